@@ -7,10 +7,15 @@ CVENT_CLIENT_ID = os.environ.get("CVENT_CLIENT_ID", "0oa1c71wn3n5CRjCK1t8")
 CVENT_CLIENT_SECRET = os.environ.get("CVENT_CLIENT_SECRET", "")
 BASE_URL = "https://api-platform.cvent.com"
 
+# One pooled session for the whole run so the token request and every page of
+# every paginated fetch reuse the same keep-alive TLS connection. Requests stay
+# serial on purpose: Cvent rate-limits aggressively (see _get).
+_session = requests.Session()
+
 
 def get_token() -> str:
     creds = base64.b64encode(f"{CVENT_CLIENT_ID}:{CVENT_CLIENT_SECRET}".encode()).decode()
-    r = requests.post(
+    r = _session.post(
         f"{BASE_URL}/ea/oauth2/token",
         headers={"Authorization": f"Basic {creds}", "Content-Type": "application/x-www-form-urlencoded"},
         data={"grant_type": "client_credentials"},
@@ -26,7 +31,7 @@ def _get(token: str, path: str, params: dict | None = None, max_retries: int = 5
     # exponential backoff, honoring Retry-After when present.
     attempt = 0
     while True:
-        r = requests.get(
+        r = _session.get(
             f"{BASE_URL}{path}",
             headers={"Authorization": f"Bearer {token}"},
             params=params or {},
@@ -3,6 +3,8 @@ from pathlib import Path
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+PAGE_SIZE = 1000
+
 
 def get_supabase() -> Client:
     load_dotenv(Path(__file__).parent / ".env")
@@ -12,6 +14,29 @@ def get_supabase() -> Client:
     )
 
 
+def iter_rows(sb: Client, table: str, columns: str, page_size: int = PAGE_SIZE, **eq):
+    """Yield every row of a filtered select, paging by id so no rows are capped.
+
+    PostgREST silently truncates unpaginated selects at its max-rows limit, so
+    this requests `id > last_id` pages until one comes back empty. A short page
+    is not treated as the end, because a project whose max-rows is below
+    page_size returns short pages. `columns` must include id; `eq` kwargs become
+    equality filters, e.g. iter_rows(sb, "enrollments", "id,status", client_id=cid).
+    """
+    last_id = None
+    while True:
+        query = sb.table(table).select(columns)
+        for column, value in eq.items():
+            query = query.eq(column, value)
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        rows = query.order("id").limit(page_size).execute().data
+        if not rows:
+            return
+        yield from rows
+        last_id = rows[-1]["id"]
+
+
 def upsert_contact(sb: Client, client_id: str, email: str, first_name: str, last_name: str) -> str:
     result = sb.table("contacts").upsert(
         {"client_id": client_id, "email": email, "first_name": first_name, "last_name": last_name},
@@ -92,7 +117,22 @@ def apply_tag(sb: Client, contact_id: str, tag: str, client_id: str | None = Non
 
 def refresh_tag_counts(sb: Client, client_id: str) -> None:
     """Recount all tag contacts for a client so the mail tool UI stays accurate."""
-    tags = sb.table("tags").select("id,name").eq("client_id", client_id).execute().data
-    for tag_row in tags:
-        result = sb.table("contacts").select("id", count="exact").eq("client_id", client_id).contains("tags", [tag_row["name"]]).execute()
-        sb.table("tags").update({"contact_count": result.count}).eq("id", tag_row["id"]).execute()
+    # get_tag_counts (migration 047) is what the Contacts page uses. It counts tag
+    # occurrences, which equals contacts only because apply_tag never stores a tag
+    # twice. Page it (rows are ordered by tag) so max-rows can't truncate the result
+    # and zero out catalog tags past the cutoff.
+    counts = {}
+    start = 0
+    while True:
+        rows = (
+            sb.rpc("get_tag_counts", {"p_client_id": client_id})
+            .range(start, start + PAGE_SIZE - 1)
+            .execute()
+            .data
+        )
+        if not rows:
+            break
+        counts.update((r["tag_name"], r["cnt"]) for r in rows)
+        start += len(rows)
+    for tag_row in iter_rows(sb, "tags", "id,name", client_id=client_id):
+        sb.table("tags").update({"contact_count": counts.get(tag_row["name"], 0)}).eq("id", tag_row["id"]).execute()
@@ -28,6 +28,8 @@ from google.oauth2.service_account import Credentials
 import gspread
 from supabase import create_client
 
+import db
+
 load_dotenv(Path(__file__).parent / ".env")
 
 SHEET_ID = os.environ.get("GOOGLE_SHEET_ID_ROSTER", "")
@@ -58,12 +60,16 @@ PROGRAM_NAME_TO_LABEL = {
 # Normalize Supabase's lowercase format strings to Karen's Title Case.
 FORMAT_DISPLAY = {"online": "Online", "in-person": "In-Person"}
 
+# Per-grade programs, e.g. "Grade 3 Teaching - Renewal 2026 Online". Compiled once;
+# program_to_session_label runs for every enrollment row.
+GRADE_PROGRAM_RE = re.compile(r"^Grade (\d) Teaching - Renewal 2026 (In-Person|Online)$")
+
 
 def program_to_session_label(name: str) -> str | None:
     """Map a Supabase program name to Karen's session label, or None if unmapped."""
     if name in PROGRAM_NAME_TO_LABEL:
         return PROGRAM_NAME_TO_LABEL[name]
-    m = re.match(r"^Grade (\d) Teaching - Renewal 2026 (In-Person|Online)$", name)
+    m = GRADE_PROGRAM_RE.match(name)
     if m:
         return f"Grade {m.group(1)} – {m.group(2)}"
     return None
@@ -78,13 +84,11 @@ def fetch_roster(sb) -> tuple[list[dict], dict[str, int]]:
     programs = sb.table("programs").select("id,name,format").eq("client_id", CFA_CLIENT_ID).execute().data
     program_by_id = {p["id"]: p for p in programs}
 
-    enrollments = (
-        sb.table("enrollments")
-        .select("program_id,contact_id,status")
-        .eq("client_id", CFA_CLIENT_ID)
-        .eq("status", "registered")
-        .execute()
-        .data
+    enrollments = list(
+        db.iter_rows(
+            sb, "enrollments", "id,program_id,contact_id,status",
+            client_id=CFA_CLIENT_ID, status="registered",
+        )
     )
 
     contact_ids = list({e["contact_id"] for e in enrollments})
@@ -22,6 +22,8 @@ from google.oauth2.service_account import Credentials
 import gspread
 from supabase import create_client
 
+import db
+
 load_dotenv(Path(__file__).parent / ".env")
 
 SHEET_ID = os.environ.get("GOOGLE_SHEET_ID", "")
@@ -44,8 +46,7 @@ def fetch_counts(sb) -> dict:
     counts = {p["name"]: {"registered": 0, "cancelled": 0, "waitlisted": 0} for p in programs}
     program_ids = {p["id"]: p["name"] for p in programs}
 
-    enrollments = sb.table("enrollments").select("program_id,status").eq("client_id", CFA_CLIENT_ID).execute().data
-    for enr in enrollments:
+    for enr in db.iter_rows(sb, "enrollments", "id,program_id,status", client_id=CFA_CLIENT_ID):
         name = program_ids.get(enr["program_id"])
         if name and name in counts:
             status = enr["status"]
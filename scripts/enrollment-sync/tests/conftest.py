@@ -0,0 +1,17 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def make_paged_sb():
+    """Factory for a mock client whose query builder chains to itself and returns `pages` in order."""
+    def _make(pages):
+        query = MagicMock()
+        for method in ("select", "eq", "gt", "in_", "order", "limit"):
+            getattr(query, method).return_value = query
+        query.execute.side_effect = [MagicMock(data=page) for page in pages]
+        sb = MagicMock()
+        sb.table.return_value = query
+        return sb, query
+    return _make
@@ -16,7 +16,14 @@ def _mock_response(data, next_token=None):
     return m
 
 
-@patch("connectors.cvent.requests.get")
+@patch("connectors.cvent._session.post")
+def test_get_token_uses_pooled_session(mock_post):
+    mock_post.return_value.json.return_value = {"access_token": "tok-123"}
+    assert cvent.get_token() == "tok-123"
+    assert mock_post.call_args.args[0].endswith("/ea/oauth2/token")
+
+
+@patch("connectors.cvent._session.get")
 def test_fetch_session_enrollments_returns_non_deleted(mock_get):
     mock_get.return_value = _mock_response([
         {"id": "enr-1", "attendee": {"id": "att-1"}, "status": "Registered", "deleted": False},
@@ -28,7 +35,7 @@ def test_fetch_session_enrollments_returns_non_deleted(mock_get):
 
 
 @patch("connectors.cvent.time.sleep")
-@patch("connectors.cvent.requests.get")
+@patch("connectors.cvent._session.get")
 def test_fetch_session_enrollments_paginates(mock_get, mock_sleep):
     mock_get.side_effect = [
         _mock_response([{"id": "enr-1", "attendee": {"id": "att-1"}, "status": "Registered"}], next_token="page2"),
@@ -39,7 +46,7 @@ def test_fetch_session_enrollments_paginates(mock_get, mock_sleep):
     mock_sleep.assert_called_once_with(2.0)
 
 
-@patch("connectors.cvent.requests.get")
+@patch("connectors.cvent._session.get")
 def test_fetch_attendees_builds_lookup_dict(mock_get):
     mock_get.return_value = _mock_response([
         {
@@ -53,7 +60,7 @@ def test_fetch_attendees_builds_lookup_dict(mock_get):
     assert result["att-1"]["raw"]["id"] == "att-1"
 
 
-@patch("connectors.cvent.requests.get")
+@patch("connectors.cvent._session.get")
 def test_fetch_sessions_returns_list(mock_get):
     mock_get.return_value = _mock_response([
         {"id": "session-1", "name": "Grade 1 Teaching"},
@@ -111,7 +118,7 @@ def _mock_error_response(status_code, headers=None):
 
 
 @patch("connectors.cvent.time.sleep")
-@patch("connectors.cvent.requests.get")
+@patch("connectors.cvent._session.get")
 def test_get_retries_on_429_then_succeeds(mock_get, mock_sleep):
     mock_get.side_effect = [
         _mock_error_response(429, headers={"Retry-After": "3"}),
@@ -127,7 +134,7 @@ def test_get_retries_on_429_then_succeeds(mock_get, mock_sleep):
 
 
 @patch("connectors.cvent.time.sleep")
-@patch("connectors.cvent.requests.get")
+@patch("connectors.cvent._session.get")
 def test_get_retries_on_5xx(mock_get, mock_sleep):
     mock_get.side_effect = [
         _mock_error_response(503),
@@ -139,7 +146,7 @@ def test_get_retries_on_5xx(mock_get, mock_sleep):
 
 
 @patch("connectors.cvent.time.sleep")
-@patch("connectors.cvent.requests.get")
+@patch("connectors.cvent._session.get")
 def test_get_does_not_retry_on_4xx_other_than_429(mock_get, mock_sleep):
     import requests as _requests
     mock_get.return_value = _mock_error_response(404)
@@ -153,7 +160,7 @@ def test_get_does_not_retry_on_4xx_other_than_429(mock_get, mock_sleep):
 
 
 @patch("connectors.cvent.time.sleep")
-@patch("connectors.cvent.requests.get")
+@patch("connectors.cvent._session.get")
 def test_get_gives_up_after_max_retries(mock_get, mock_sleep):
     import requests as _requests
     mock_get.return_value = _mock_error_response(429)
@@ -117,3 +117,46 @@ def test_apply_tag_handles_null_tags():
     db.apply_tag(sb, "contact-uuid-1", "new-tag")
     update_call = sb.table.return_value.update.call_args
     assert update_call[0][0]["tags"] == ["new-tag"]
+
+
+def test_iter_rows_pages_by_id_until_empty_page(make_paged_sb):
+    sb, query = make_paged_sb([[{"id": "a"}, {"id": "b"}], [{"id": "c"}], []])
+    rows = list(db.iter_rows(sb, "enrollments", "id,status", page_size=2, client_id="client-1"))
+    assert [r["id"] for r in rows] == ["a", "b", "c"]
+    assert query.execute.call_count == 3
+    assert [c.args for c in query.gt.call_args_list] == [("id", "b"), ("id", "c")]
+    query.eq.assert_called_with("client_id", "client-1")
+    query.order.assert_called_with("id")
+
+
+def test_iter_rows_keeps_paging_past_server_capped_short_page(make_paged_sb):
+    """A max-rows cap below page_size returns short pages; they must not end the scan."""
+    sb, query = make_paged_sb([[{"id": "a"}], [{"id": "b"}], []])
+    rows = list(db.iter_rows(sb, "contacts", "id,tags", page_size=1000))
+    assert [r["id"] for r in rows] == ["a", "b"]
+    assert query.execute.call_count == 3
+    query.eq.assert_not_called()
+
+
+def test_refresh_tag_counts_pages_get_tag_counts_rpc(make_paged_sb):
+    sb, query = make_paged_sb([
+        [{"id": "t1", "name": "a"}, {"id": "t2", "name": "b"}, {"id": "t3", "name": "c"}, {"id": "t4", "name": "unused"}],
+        [],
+    ])
+    rpc = sb.rpc.return_value
+    rpc.range.return_value = rpc
+    rpc.execute.side_effect = [
+        MagicMock(data=[{"tag_name": "a", "cnt": 2}, {"tag_name": "b", "cnt": 1}]),
+        MagicMock(data=[{"tag_name": "c", "cnt": 5}]),
+        MagicMock(data=[]),
+    ]
+    db.refresh_tag_counts(sb, "client-1")
+    sb.rpc.assert_called_with("get_tag_counts", {"p_client_id": "client-1"})
+    assert [c.args for c in rpc.range.call_args_list] == [
+        (0, db.PAGE_SIZE - 1),
+        (2, db.PAGE_SIZE + 1),
+        (3, db.PAGE_SIZE + 2),
+    ]
+    updates = [c.args[0]["contact_count"] for c in query.update.call_args_list]
+    assert updates == [2, 1, 5, 0]
+    query.eq.assert_any_call("client_id", "client-1")
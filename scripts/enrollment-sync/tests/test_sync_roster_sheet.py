@@ -115,3 +115,26 @@ def test_session_rank_puts_grade_8_in_person_before_special_subjects():
 
 def test_session_rank_puts_community_gatherings_last():
     assert s.SESSION_RANK["Community Gatherings Only"] == max(s.SESSION_RANK.values())
+
+
+# --- fetch_roster ---
+
+
+def test_fetch_roster_pages_registered_enrollments_by_id(make_paged_sb):
+    sb, query = make_paged_sb([
+        [{"id": "p1", "name": "Grade 2 Teaching - Renewal 2026 In-Person", "format": "in-person"}],
+        [{"id": "e1", "program_id": "p1", "contact_id": "c1", "status": "registered"}],
+        [],
+        [{"id": "c1", "first_name": " Ana ", "last_name": "Adams", "email": "a@x"}],
+    ])
+    rows, counts = s.fetch_roster(sb)
+    assert rows == [{
+        "session": "Grade 2 – In-Person", "type": "In-Person",
+        "first_name": "Ana", "last_name": "Adams", "email": "a@x",
+    }]
+    assert counts["Grade 2 – In-Person"] == 1
+    assert query.select.call_args_list[1].args == ("id,program_id,contact_id,status",)
+    eq_calls = [c.args for c in query.eq.call_args_list]
+    assert ("client_id", s.CFA_CLIENT_ID) in eq_calls
+    assert ("status", "registered") in eq_calls
+    query.gt.assert_called_once_with("id", "e1")
@@ -115,3 +115,25 @@ def test_total_rows_are_not_treated_as_unknown_programs():
 
     assert by_range["C12:F12"] == [["0", "0", "0", UPDATED_AT]]
     assert by_range["C23:F23"] == [["0", "0", "0", UPDATED_AT]]
+
+
+# --- fetch_counts ---
+
+
+def test_fetch_counts_pages_enrollments_by_id(make_paged_sb):
+    sb, query = make_paged_sb([
+        [{"id": "p1", "name": "Grade 1 Teaching - Renewal 2026 Online"}],
+        [
+            {"id": "e1", "program_id": "p1", "status": "registered"},
+            {"id": "e2", "program_id": "p1", "status": "cancelled"},
+            {"id": "e3", "program_id": "p-unknown", "status": "registered"},
+        ],
+        [],
+    ])
+    counts = sync_sheet.fetch_counts(sb)
+    assert counts == {
+        "Grade 1 Teaching - Renewal 2026 Online": {"registered": 1, "cancelled": 1, "waitlisted": 0},
+    }
+    assert query.select.call_args_list[1].args == ("id,program_id,status",)
+    query.eq.assert_called_with("client_id", sync_sheet.CFA_CLIENT_ID)
+    query.gt.assert_called_once_with("id", "e3")